@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+# Model input columns, in the order main.py trains on them
+FEATURES = [
+    'study_hours_per_day',
+    'exercise_frequency',
+    'social_media_hours',
+    'netflix_hours',
+    'sleep_hours',
+    'mental_health_rating',
+    'attendance_percentage'
+]
+
+# Title, a tip for when the feature is already helping the score, and tips
+# for when the model says the feature should go up / down to help it
+FEATURE_TIPS = {
+    'study_hours_per_day': (
+        "📖 Study Time",
+        "Great job! Your study time is one of your biggest strengths",
+        "More focused study time would lift your predicted score",
+        "Trading some study hours for rest and review breaks could help"
+    ),
+    'exercise_frequency': (
+        "🏃 Physical Activity",
+        "Great! Your exercise routine is boosting your predicted score",
+        "Add 2-3 exercise sessions weekly to boost cognitive function",
+        "Fewer exercise sessions could leave more energy for studying"
+    ),
+    'social_media_hours': (
+        "📱 Digital Wellness",
+        "Your social media habits are working in your favour",
+        "A bit more time connecting with friends could help you recharge",
+        "Consider reducing social media to improve focus during study"
+    ),
+    'netflix_hours': (
+        "🎬 Entertainment",
+        "Your entertainment time is well balanced with your studies",
+        "A little more downtime could help you recharge",
+        "Cutting back on Netflix and gaming would free up time for learning"
+    ),
+    'sleep_hours': (
+        "😴 Sleep Quality",
+        "Excellent! Your sleep is supporting optimal learning",
+        "Aim for 7-9 hours - sleep is crucial for memory consolidation",
+        "Your sleep time could be traded for a little more study or exercise"
+    ),
+    'mental_health_rating': (
+        "🧘 Mental Health",
+        "Great mental wellbeing! This positively impacts your learning",
+        "Consider stress management techniques or seeking support",
+        "Your wellbeing rating is linked to a lower score here - a chat with a counselor may help"
+    ),
+    'attendance_percentage': (
+        "🏫 Class Attendance",
+        "Outstanding attendance! You're maximizing learning opportunities",
+        "Improve attendance - it's strongly linked to better scores",
+        "Your attendance is linked to a lower score here - focus on making class time count"
+    )
+}
+
+
+def feature_contributions(model, scaler, X):
+    """Per-feature contribution to the predicted score, in exam points.
+
+    Each contribution is coef * (x - training mean) / training std, so for
+    every row the contributions plus model.intercept_ add up to the raw
+    prediction. Works on a single row or a whole batch at once.
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    X_scaled = (X - scaler.mean_) / scaler.scale_
+    return X_scaled * np.asarray(model.coef_, dtype=float)
+
+
+def rank_levers(contributions, top_n=None):
+    """Column indices of each row's features, biggest absolute effect first."""
+    contributions = np.atleast_2d(contributions)
+    order = np.argsort(-np.abs(contributions), axis=1, kind='stable')
+    return order if top_n is None else order[:, :top_n]
+
+
+def explain_batch(model, scaler, X):
+    """Contribution table for batch scoring: one column per feature plus
+    the baseline (average student), the raw prediction and the top lever.
+
+    DataFrames are matched to FEATURES by column name, so a raw CSV frame
+    or reordered columns are fine; arrays must already be in FEATURES order.
+    """
+    index = None
+    if isinstance(X, pd.DataFrame):
+        X, index = X[FEATURES], X.index
+    contributions = feature_contributions(model, scaler, X)
+    result = pd.DataFrame(contributions, columns=FEATURES, index=index)
+    result['baseline'] = float(model.intercept_)
+    result['prediction'] = result['baseline'] + contributions.sum(axis=1)
+    result['top_lever'] = np.asarray(FEATURES)[rank_levers(contributions, 1)[:, 0]]
+    return result
+
+
+def generate_tips(contributions, coef, top_n=4, min_impact=0.5):
+    """Tips for a single row, driven by its largest contributions.
+
+    Features helping the score get the keep tip; for the others the sign of
+    the model's coefficient decides whether to advise increasing or
+    decreasing them, so a cohort model with flipped signs gets matching
+    advice. Features moving the score by less than min_impact points are
+    skipped, so an empty list means the student is close to the average
+    profile.
+    """
+    contributions = np.atleast_2d(contributions)[0]
+    coef = np.asarray(coef, dtype=float)
+    tips = []
+    for i in rank_levers(contributions, top_n)[0]:
+        impact = contributions[i]
+        if abs(impact) < min_impact:
+            break
+        title, keep_tip, increase_tip, decrease_tip = FEATURE_TIPS[FEATURES[i]]
+        if impact > 0:
+            direction, message = "keep", keep_tip
+        elif coef[i] > 0:
+            direction, message = "increase", increase_tip
+        else:
+            direction, message = "decrease", decrease_tip
+        tips.append({
+            "feature": FEATURES[i],
+            "title": title,
+            "impact": float(impact),
+            "direction": direction,
+            "message": message
+        })
+    return tips
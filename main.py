@@ -1,3 +1,4 @@
+import argparse
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
@@ -5,60 +6,146 @@ from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import joblib
+from explain import FEATURES
+from evaluate import bootstrap_metrics, repeated_kfold_metrics, write_report
+from registry import ModelRegistry
 
-# Load the dataset
-df = pd.read_csv("student_habits_performance.csv")
-
-# Handle missing values
-df['parental_education_level'] = df['parental_education_level'].fillna(df['parental_education_level'].mode()[0])
-
-# Drop unnecessary columns
-df.drop(columns=['student_id'], inplace=True)
-
-# Encode categorical features
-categorical_cols = df.select_dtypes(include='object').columns
-le = LabelEncoder()
-for col in categorical_cols:
-    df[col] = le.fit_transform(df[col])
-
-# Define features and target
-selected_features = [
-    'study_hours_per_day',
-    'exercise_frequency',
-    'social_media_hours',
-    'netflix_hours',
-    'sleep_hours',
-    'mental_health_rating',
-    'attendance_percentage'
-]
-X = df[selected_features]
-y = df['exam_score']
-
-# Scale features
-scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X)
-
-# Train-test split
-X_train, X_test, y_train, y_test = train_test_split(
-    X_scaled, y, test_size=0.2, random_state=42
-)
-
-# Train model
-model = LinearRegression()
-model.fit(X_train, y_train)
-
-# Evaluate model
-y_pred = model.predict(X_test)
-mae = mean_absolute_error(y_test, y_pred)
-mse = mean_squared_error(y_test, y_pred)
-rmse = np.sqrt(mse)
-r2 = r2_score(y_test, y_pred)
-
-print(f"✅ MAE: {mae:.2f}")
-print(f"✅ MSE: {mse:.2f}")
-print(f"✅ RMSE: {rmse:.2f}")
-print(f"✅ R-squared: {r2:.2f}")
-
-# Save model and scaler
-joblib.dump(model, "linear_regression_model.pkl")
-joblib.dump(scaler, "scaler.pkl")
+
+def load_data(path):
+    # Load the dataset
+    df = pd.read_csv(path)
+
+    # Handle missing values
+    df['parental_education_level'] = df['parental_education_level'].fillna(df['parental_education_level'].mode()[0])
+
+    # Drop unnecessary columns
+    df.drop(columns=['student_id'], inplace=True)
+
+    # Encode categorical features
+    categorical_cols = df.select_dtypes(include='object').columns
+    le = LabelEncoder()
+    for col in categorical_cols:
+        df[col] = le.fit_transform(df[col])
+
+    # Define features and target
+    return df[FEATURES], df['exam_score']
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Train the exam score model")
+    parser.add_argument("--data", default="student_habits_performance.csv")
+    parser.add_argument("--evaluate", action="store_true",
+                        help="Also compute bootstrap and repeated k-fold metrics")
+    parser.add_argument("--bootstrap", type=int, default=2000,
+                        help="Number of bootstrap replicates")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes (default: one per CPU)")
+    parser.add_argument("--report", default="evaluation_report.json",
+                        help="Report path; use a .html extension for an HTML report")
+    parser.add_argument("--cohort", default=None,
+                        help="Register the model under this cohort (school) ID instead "
+                             "of overwriting the default model files")
+    parser.add_argument("--registry", default="models",
+                        help="Model registry directory used with --cohort")
+    return parser
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.bootstrap < 1:
+        parser.error("--bootstrap must be at least 1")
+    if args.folds < 2:
+        parser.error("--folds must be at least 2")
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    if not 0 < args.confidence < 1:
+        parser.error("--confidence must be between 0 and 1")
+
+    X, y = load_data(args.data)
+    if args.evaluate and args.folds > len(y):
+        parser.error(f"--folds can't exceed the number of rows ({len(y)})")
+
+    # Scale features
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+
+    # Train-test split
+    X_train, X_test, y_train, y_test = train_test_split(
+        X_scaled, y, test_size=0.2, random_state=42
+    )
+
+    # Train model
+    model = LinearRegression()
+    model.fit(X_train, y_train)
+
+    # Evaluate model
+    y_pred = model.predict(X_test)
+    mae = mean_absolute_error(y_test, y_pred)
+    mse = mean_squared_error(y_test, y_pred)
+    rmse = np.sqrt(mse)
+    r2 = r2_score(y_test, y_pred)
+
+    print(f"✅ MAE: {mae:.2f}")
+    print(f"✅ MSE: {mse:.2f}")
+    print(f"✅ RMSE: {rmse:.2f}")
+    print(f"✅ R-squared: {r2:.2f}")
+
+    # Bootstrap CIs on the held-out split and repeated k-fold on the full data
+    if args.evaluate:
+        bootstrap = bootstrap_metrics(
+            y_test, y_pred, n_bootstrap=args.bootstrap,
+            confidence=args.confidence, seed=args.seed, n_jobs=args.jobs
+        )
+        kfold = repeated_kfold_metrics(
+            X_scaled, y, n_splits=args.folds, n_repeats=args.repeats,
+            confidence=args.confidence, seed=args.seed, n_jobs=args.jobs
+        )
+        bootstrap_label = f"{args.confidence:.0%} bootstrap CI"
+        kfold_label = f"{args.confidence:.0%} range of per-repeat means"
+        for name, label, metrics in [
+            ("Bootstrap", bootstrap_label, bootstrap),
+            (f"{args.repeats}x{args.folds}-fold CV", kfold_label, kfold)
+        ]:
+            for metric, s in metrics.items():
+                print(f"📊 {name} {metric.upper()}: {s['mean']:.2f} "
+                      f"({label} [{s['lower']:.2f}, {s['upper']:.2f}])")
+
+        write_report({
+            "holdout": {"mae": mae, "mse": mse, "rmse": float(rmse), "r2": r2},
+            "bootstrap": {
+                "interval": bootstrap_label,
+                "replicates": args.bootstrap,
+                "confidence": args.confidence,
+                "seed": args.seed,
+                "metrics": bootstrap
+            },
+            "kfold": {
+                "interval": kfold_label,
+                "folds": args.folds,
+                "repeats": args.repeats,
+                "confidence": args.confidence,
+                "seed": args.seed,
+                "metrics": kfold
+            }
+        }, args.report)
+        print(f"📝 Report written to {args.report}")
+
+    # Save model and scaler
+    if args.cohort:
+        version = ModelRegistry(args.registry).register(
+            args.cohort, model, scaler,
+            metrics={"mae": mae, "mse": mse, "rmse": float(rmse), "r2": r2}
+        )
+        print(f"📦 Registered {args.cohort} v{version} in {args.registry}/")
+    else:
+        joblib.dump(model, "linear_regression_model.pkl")
+        joblib.dump(scaler, "scaler.pkl")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+
+import joblib
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+MODEL_FILE = "linear_regression_model.pkl"
+SCALER_FILE = "scaler.pkl"
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+
+_COHORT_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+def _check_cohort(cohort_id):
+    if not _COHORT_ID.match(cohort_id):
+        raise ValueError(f"Invalid cohort ID: {cohort_id!r}")
+
+
+class ModelRegistry:
+    """Versioned model/scaler artifacts per cohort, laid out as
+    <root>/<cohort_id>/v<N>/ with an index.json describing every version.
+    """
+
+    def __init__(self, root="models"):
+        self.root = root
+        # (stat signature, parsed index) of the last index.json read
+        self._cached_index = (None, {})
+
+    @property
+    def index_path(self):
+        return os.path.join(self.root, INDEX_FILE)
+
+    @contextmanager
+    def _write_lock(self):
+        # Inter-process lock, so concurrent main.py runs don't lose entries
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, LOCK_FILE), "a+") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read_index(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        with open(self.index_path) as f:
+            return json.load(f)
+
+    def load_index(self):
+        """The parsed index, re-read only when index.json changes on disk.
+
+        The returned dict is shared; treat it as read-only.
+        """
+        try:
+            st = os.stat(self.index_path)
+            signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except FileNotFoundError:
+            return {}
+        cached_signature, index = self._cached_index
+        if signature != cached_signature:
+            index = self._read_index()
+            self._cached_index = (signature, index)
+        return index
+
+    def _save_index(self, index):
+        # Write to a temp file first so readers never see a half-written index
+        with tempfile.NamedTemporaryFile("w", dir=self.root, suffix=".tmp",
+                                         delete=False) as f:
+            json.dump(index, f, indent=2)
+        os.replace(f.name, self.index_path)
+
+    def cohorts(self):
+        return sorted(self.load_index())
+
+    def latest_version(self, cohort_id):
+        versions = self.load_index().get(cohort_id)
+        if not versions:
+            raise KeyError(f"No models registered for cohort {cohort_id!r}")
+        return versions[-1]["version"]
+
+    def register(self, cohort_id, model, scaler, metrics=None):
+        """Save a new version of the cohort's model and scaler, return its number."""
+        _check_cohort(cohort_id)
+        with self._write_lock():
+            index = self._read_index()
+            versions = index.setdefault(cohort_id, [])
+            version = versions[-1]["version"] + 1 if versions else 1
+            path = os.path.join(cohort_id, f"v{version}")
+            os.makedirs(os.path.join(self.root, path), exist_ok=True)
+            joblib.dump(model, os.path.join(self.root, path, MODEL_FILE))
+            joblib.dump(scaler, os.path.join(self.root, path, SCALER_FILE))
+            versions.append({
+                "version": version,
+                "path": path,
+                "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "metrics": metrics or {}
+            })
+            self._save_index(index)
+        return version
+
+    def artifact_paths(self, cohort_id, version=None):
+        _check_cohort(cohort_id)
+        if version is None:
+            version = self.latest_version(cohort_id)
+        for entry in self.load_index().get(cohort_id, []):
+            if entry["version"] == version:
+                directory = os.path.join(self.root, entry["path"])
+                return (os.path.join(directory, MODEL_FILE),
+                        os.path.join(directory, SCALER_FILE))
+        raise KeyError(f"Cohort {cohort_id!r} has no version {version}")
+
+    def load(self, cohort_id, version=None):
+        model_path, scaler_path = self.artifact_paths(cohort_id, version)
+        return joblib.load(model_path), joblib.load(scaler_path)
+
+
+class ModelCache:
+    """Keeps recently used cohort models in memory, evicting the least
+    recently used once max_models or max_artifact_bytes is exceeded.
+
+    The byte budget counts the on-disk size of each resident model's
+    pickled artifacts, not the memory of the loaded objects.
+    """
+
+    def __init__(self, registry, max_models=8, max_artifact_bytes=None):
+        self.registry = registry
+        self.max_models = max_models
+        self.max_artifact_bytes = max_artifact_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "evictions": 0,
+                      "artifact_bytes": 0}
+
+    def get(self, cohort_id, version=None):
+        """Return (model, scaler) for a cohort, loading it on first use.
+
+        Without a version the latest one is used, which costs a stat of
+        index.json; pass a version to serve hits without touching disk.
+        If two threads miss on the same model at once both read it, but only
+        the first is stored and counted in stats["loads"].
+        """
+        if version is None:
+            version = self.registry.latest_version(cohort_id)
+        key = (cohort_id, version)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return self._entries[key][:2]
+            self.stats["misses"] += 1
+
+        # Load outside the lock so a slow disk doesn't block other cohorts
+        paths = self.registry.artifact_paths(cohort_id, version)
+        model, scaler = joblib.load(paths[0]), joblib.load(paths[1])
+        size = sum(os.path.getsize(p) for p in paths)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (model, scaler, size)
+                self.stats["loads"] += 1
+                self.stats["artifact_bytes"] += size
+            self._entries.move_to_end(key)
+            self._evict()
+            return self._entries[key][:2]
+
+    def _evict(self):
+        # Always keep the most recently used entry, even if it alone is too big
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_models
+            or (self.max_artifact_bytes is not None
+                and self.stats["artifact_bytes"] > self.max_artifact_bytes)
+        ):
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self.stats["artifact_bytes"] -= size
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.stats["artifact_bytes"] = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache(root=None, max_models=None, max_artifact_bytes=None):
+    """Process-wide model cache, created on first call.
+
+    Settings left as None use the existing cache's values (or the defaults
+    on first call); passing settings that differ from the existing cache
+    raises ValueError rather than being silently ignored.
+    """
+    global _cache
+    settings = {
+        "root": root,
+        "max_models": max_models,
+        "max_artifact_bytes": max_artifact_bytes
+    }
+    with _cache_lock:
+        if _cache is None:
+            _cache = ModelCache(
+                ModelRegistry(root or "models"),
+                8 if max_models is None else max_models,
+                max_artifact_bytes
+            )
+            return _cache
+        current = {
+            "root": _cache.registry.root,
+            "max_models": _cache.max_models,
+            "max_artifact_bytes": _cache.max_artifact_bytes
+        }
+        for name, value in settings.items():
+            if value is not None and value != current[name]:
+                raise ValueError(
+                    f"Model cache already created with {name}={current[name]!r}, "
+                    f"got {name}={value!r}"
+                )
+        return _cache
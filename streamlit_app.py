@@ -7,6 +7,8 @@ import plotly.graph_objects as go
 import plotly.express as px
 from streamlit_extras.colored_header import colored_header
 import time
+from explain import feature_contributions, generate_tips
+from registry import get_cache
 
 # Page Config
 st.set_page_config(
@@ -216,7 +218,7 @@ st.markdown("""
 
 # Load model and scaler
 @st.cache_resource
-def load_models():
+def load_default_models():
     try:
         model = joblib.load("linear_regression_model.pkl")
         scaler = joblib.load("scaler.pkl")
@@ -226,7 +228,16 @@ def load_models():
         st.info("Please ensure 'linear_model.pkl' and 'scaler.pkl' are in the same directory")
         st.stop()
 
-model, scaler = load_models()
+def load_models(cohort_id=None):
+    # Cohort models come from the registry through the process-wide LRU cache
+    if cohort_id is None:
+        return load_default_models()
+    try:
+        return get_cache().get(cohort_id)
+    except Exception as e:
+        st.error(f"❌ Error loading model for '{cohort_id}': {str(e)}")
+        st.info("Train it with 'python main.py --cohort <id> --data <csv>'")
+        st.stop()
 
 # Initialize session state
 if "study_hours" not in st.session_state:
@@ -244,6 +255,21 @@ if "show_insights" not in st.session_state:
 
 # Sidebar
 with st.sidebar:
+    cohort_id = None
+    try:
+        cohorts = get_cache().registry.cohorts()
+    except Exception as e:
+        st.warning(f"⚠️ Couldn't read the model registry, using the default model: {str(e)}")
+        cohorts = []
+    if cohorts:
+        st.markdown("### 🏫 School")
+        cohort_id = st.selectbox(
+            "Model",
+            [None] + cohorts,
+            format_func=lambda c: "Default" if c is None else c
+        )
+        st.markdown("---")
+    
     st.markdown("### 🎯 Quick Stats")
     
     if st.session_state.history:
@@ -270,6 +296,8 @@ with st.sidebar:
         st.session_state.history = []
         st.rerun()
 
+model, scaler = load_models(cohort_id)
+
 # Main content in container
 st.markdown('<div class="main-container">', unsafe_allow_html=True)
 
@@ -509,113 +537,23 @@ if st.button("🚀 Predict My Exam Score", use_container_width=True):
                 if show_tips:
                     st.markdown('<div class="section-header">💡 Personalized Insights</div>', unsafe_allow_html=True)
                     
-                    insight_cols = st.columns(2)
-                    insights_shown = False
+                    # Tips come from what the model learned: rank each feature's
+                    # contribution to this prediction and explain the biggest levers
+                    contributions = feature_contributions(model, scaler, input_data)
+                    tips = generate_tips(contributions, model.coef_)
                     
-                    with insight_cols[0]:
-                        # Study insights
-                        if st.session_state.study_hours < 3:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>📖 Study Time</strong><br>
-                                Consider increasing to 3-6 hours daily for better retention
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        elif st.session_state.study_hours >= 6:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>📖 Study Time</strong><br>
-                                Great job! You're dedicating good time to studying
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        
-                        if st.session_state.sleep_hours < 6:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>😴 Sleep Quality</strong><br>
-                                Aim for 7-9 hours - sleep is crucial for memory consolidation
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        elif st.session_state.sleep_hours >= 8:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>😴 Sleep Quality</strong><br>
-                                Excellent! You're getting enough sleep for optimal learning
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        
-                        if exercise_frequency < 2:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>🏃 Physical Activity</strong><br>
-                                Add 2-3 exercise sessions weekly to boost cognitive function
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        elif exercise_frequency >= 4:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>🏃 Physical Activity</strong><br>
-                                Great! Regular exercise is boosting your cognitive performance
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
+                    insight_cols = st.columns(2)
+                    insights_shown = bool(tips)
                     
-                    with insight_cols[1]:
-                        if st.session_state.social_media_hours > 3:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>📱 Digital Wellness</strong><br>
-                                Consider reducing social media to improve focus during study
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        elif st.session_state.social_media_hours <= 1:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>📱 Digital Wellness</strong><br>
-                                Excellent digital discipline! This helps maintain focus
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        
-                        if mental_health_rating < 5:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>🧘 Mental Health</strong><br>
-                                Consider stress management techniques or seeking support
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        elif mental_health_rating >= 8:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>🧘 Mental Health</strong><br>
-                                Great mental wellbeing! This positively impacts your learning
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        
-                        if attendance_percentage < 80:
-                            st.markdown("""
-                            <div class="tip-card">
-                                <strong>🏫 Class Attendance</strong><br>
-                                Improve attendance - it's strongly linked to better scores
-                            </div>
-                            """, unsafe_allow_html=True)
-                            insights_shown = True
-                        elif attendance_percentage >= 95:
-                            st.markdown("""
+                    for i, tip in enumerate(tips):
+                        with insight_cols[i % 2]:
+                            direction = "+" if tip['impact'] > 0 else "−"
+                            st.markdown(f"""
                             <div class="tip-card">
-                                <strong>🏫 Class Attendance</strong><br>
-                                Outstanding attendance! You're maximizing learning opportunities
+                                <strong>{tip['title']}</strong> ({direction}{abs(tip['impact']):.1f} pts)<br>
+                                {tip['message']}
                             </div>
                             """, unsafe_allow_html=True)
-                            insights_shown = True
                     
                     # Show general insights if no specific ones were triggered
                     if not insights_shown:
@@ -0,0 +1,28 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from explain import FEATURES  # noqa: E402
+
+
+@pytest.fixture
+def habits():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.uniform(0, 10, size=(200, len(FEATURES))), columns=FEATURES)
+    y = 40 + X.values @ np.linspace(3, -2, len(FEATURES)) + rng.normal(0, 2, 200)
+    return X, y
+
+
+@pytest.fixture
+def trained(habits):
+    X, y = habits
+    scaler = StandardScaler().fit(X.values)
+    model = LinearRegression().fit(scaler.transform(X.values), y)
+    return model, scaler
@@ -0,0 +1,83 @@
+import json
+
+import numpy as np
+import pytest
+
+import evaluate
+from evaluate import (MAX_BLOCK_BYTES, METRICS, _bootstrap_block, _resampled_metrics,
+                      batch_metrics, bootstrap_metrics, repeated_kfold_metrics,
+                      write_report)
+
+
+@pytest.fixture
+def predictions():
+    rng = np.random.default_rng(1)
+    y_true = rng.uniform(40, 100, 300)
+    return y_true, y_true + rng.normal(0, 5, 300)
+
+
+def test_batch_metrics_matches_sklearn(predictions):
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    y_true, y_pred = predictions
+    scores = batch_metrics(y_true[None, :], y_pred[None, :])
+    assert scores['mae'][0] == pytest.approx(mean_absolute_error(y_true, y_pred))
+    assert scores['mse'][0] == pytest.approx(mean_squared_error(y_true, y_pred))
+    assert scores['r2'][0] == pytest.approx(r2_score(y_true, y_pred))
+
+
+def test_resampled_metrics_match_batch_metrics(predictions):
+    y_true, y_pred = predictions
+    idx = np.random.default_rng(2).integers(0, len(y_true), size=(20, len(y_true)))
+    fast = _resampled_metrics(y_true - y_pred, y_true - y_true.mean(), idx)
+    slow = batch_metrics(y_true[idx], y_pred[idx])
+    for m in METRICS:
+        np.testing.assert_allclose(fast[m], slow[m])
+
+
+@pytest.mark.parametrize("n", [10, 1_000, 100_000, 1_000_000, 10_000_000])
+def test_bootstrap_blocks_stay_within_memory_bound(n):
+    block, block_bytes = _bootstrap_block(n)
+    assert block >= 1
+    assert block_bytes <= max(MAX_BLOCK_BYTES, n * 12)
+    # Large samples are split into many blocks so workers can share them
+    if n >= 1_000_000:
+        assert block < 250
+
+
+def test_bootstrap_is_identical_across_n_jobs(predictions, monkeypatch):
+    # Small blocks so the replicates are spread over several tasks
+    monkeypatch.setattr(evaluate, 'MAX_BLOCK_REPLICATES', 50)
+    y_true, y_pred = predictions
+    serial = bootstrap_metrics(y_true, y_pred, n_bootstrap=400, n_jobs=1)
+    parallel = bootstrap_metrics(y_true, y_pred, n_bootstrap=400, n_jobs=3)
+    assert serial == parallel
+
+
+def test_bootstrap_interval_contains_point_estimate(predictions):
+    y_true, y_pred = predictions
+    result = bootstrap_metrics(y_true, y_pred, n_bootstrap=500, n_jobs=1)
+    point = batch_metrics(y_true[None, :], y_pred[None, :])
+    for m in METRICS:
+        assert result[m]['lower'] <= point[m][0] <= result[m]['upper']
+
+
+def test_repeated_kfold_is_identical_across_n_jobs(habits):
+    X, y = habits
+    serial = repeated_kfold_metrics(X, y, n_splits=4, n_repeats=3, n_jobs=1)
+    parallel = repeated_kfold_metrics(X, y, n_splits=4, n_repeats=3, n_jobs=2)
+    assert serial == parallel
+    assert serial['r2']['mean'] > 0.9
+
+
+def test_write_report_json_and_html(tmp_path, predictions):
+    y_true, y_pred = predictions
+    metrics = bootstrap_metrics(y_true, y_pred, n_bootstrap=20, n_jobs=1)
+    report = {
+        "holdout": {"mae": 1.0, "mse": 2.0, "rmse": 1.4, "r2": 0.9},
+        "bootstrap": {"replicates": 20, "metrics": metrics},
+        "kfold": {"folds": 5, "metrics": metrics}
+    }
+    write_report(report, str(tmp_path / "report.json"))
+    assert json.loads((tmp_path / "report.json").read_text()) == report
+    write_report(report, str(tmp_path / "report.html"))
+    assert "<table>" in (tmp_path / "report.html").read_text()
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from explain import (FEATURE_TIPS, FEATURES, explain_batch, feature_contributions,
+                     generate_tips, rank_levers)
+
+
+def test_contributions_add_up_to_prediction(habits, trained):
+    X, _ = habits
+    model, scaler = trained
+    contributions = feature_contributions(model, scaler, X.values)
+    expected = model.predict(scaler.transform(X.values))
+    np.testing.assert_allclose(model.intercept_ + contributions.sum(axis=1), expected)
+
+
+def test_single_row_matches_batch(habits, trained):
+    X, _ = habits
+    model, scaler = trained
+    batch = feature_contributions(model, scaler, X.values)
+    np.testing.assert_allclose(feature_contributions(model, scaler, X.values[3]), batch[[3]])
+
+
+def test_explain_batch_matches_columns_by_name(habits, trained):
+    X, _ = habits
+    model, scaler = trained
+    shuffled = X[FEATURES[::-1]].assign(student_id=range(len(X)))
+    result = explain_batch(model, scaler, shuffled)
+    np.testing.assert_allclose(result['prediction'], model.predict(scaler.transform(X.values)))
+    np.testing.assert_allclose(result[FEATURES].values, feature_contributions(model, scaler, X.values))
+    assert list(result.index) == list(X.index)
+
+
+def test_rank_levers_orders_by_absolute_impact():
+    contributions = np.array([[0.1, -3.0, 2.0], [5.0, 0.0, -1.0]])
+    np.testing.assert_array_equal(rank_levers(contributions), [[1, 2, 0], [0, 2, 1]])
+    np.testing.assert_array_equal(rank_levers(contributions, 1), [[1], [0]])
+
+
+def test_generate_tips_respects_min_impact():
+    contributions = np.zeros(len(FEATURES))
+    contributions[0] = 2.0
+    contributions[4] = -1.0
+    contributions[2] = 0.3
+    coef = np.ones(len(FEATURES))
+
+    tips = generate_tips(contributions, coef, min_impact=0.5)
+    assert [t['feature'] for t in tips] == [FEATURES[0], FEATURES[4]]
+    assert tips[0]['impact'] == pytest.approx(2.0)
+    assert generate_tips(contributions, coef, min_impact=5.0) == []
+
+
+def test_generate_tips_follow_coefficient_sign(habits, trained):
+    X, _ = habits
+    model, scaler = trained
+    netflix = FEATURES.index('netflix_hours')
+    # A student who watches nothing: netflix is well below the training mean
+    row = X.values[:1].copy()
+    row[0, netflix] = 0.0
+    _, _, increase_tip, decrease_tip = FEATURE_TIPS['netflix_hours']
+
+    model.coef_ = np.zeros(len(FEATURES))
+    model.coef_[netflix] = -2.5
+    tip, = generate_tips(feature_contributions(model, scaler, row), model.coef_)
+    assert tip['impact'] > 0 and tip['direction'] == "keep"
+
+    # Flipped coefficient: more netflix predicts a higher score in this cohort
+    model.coef_[netflix] = 2.5
+    tip, = generate_tips(feature_contributions(model, scaler, row), model.coef_)
+    assert tip['impact'] < 0
+    assert tip['direction'] == "increase"
+    assert tip['message'] == increase_tip != decrease_tip
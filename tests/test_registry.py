@@ -0,0 +1,121 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import joblib
+import pytest
+
+import registry
+from registry import ModelCache, ModelRegistry, get_cache
+
+
+def _register_many(root, cohort_id, count):
+    reg = ModelRegistry(root)
+    return [reg.register(cohort_id, {"coef": i}, {"mean": i}) for i in range(count)]
+
+
+@pytest.fixture
+def reg(tmp_path):
+    return ModelRegistry(str(tmp_path / "models"))
+
+
+def test_register_increments_versions(reg):
+    assert reg.register("school-a", {"coef": 1}, {"mean": 1}) == 1
+    assert reg.register("school-a", {"coef": 2}, {"mean": 2}, metrics={"r2": 0.9}) == 2
+    assert reg.register("school-b", {"coef": 3}, {"mean": 3}) == 1
+    assert reg.cohorts() == ["school-a", "school-b"]
+    assert reg.latest_version("school-a") == 2
+    assert reg.load("school-a", 1) == ({"coef": 1}, {"mean": 1})
+    assert reg.load("school-a") == ({"coef": 2}, {"mean": 2})
+    assert reg.load_index()["school-a"][1]["metrics"] == {"r2": 0.9}
+
+
+def test_register_is_safe_across_processes(reg):
+    with multiprocessing.Pool(4) as pool:
+        results = pool.starmap(_register_many, [(reg.root, "school-a", 5)] * 4)
+    versions = sorted(v for r in results for v in r)
+    assert versions == list(range(1, 21))
+    assert [e["version"] for e in reg.load_index()["school-a"]] == versions
+    assert not [f for f in os.listdir(reg.root) if f.endswith(".tmp")]
+
+
+def test_invalid_cohort_and_unknown_version(reg):
+    with pytest.raises(ValueError):
+        reg.register("../escape", {}, {})
+    reg.register("school-a", {}, {})
+    with pytest.raises(KeyError):
+        reg.artifact_paths("school-a", 7)
+    with pytest.raises(KeyError):
+        reg.latest_version("school-z")
+
+
+def test_cache_counts_hits_loads_and_lru_evictions(reg):
+    for cohort in ["a", "b", "c"]:
+        reg.register(cohort, {"cohort": cohort}, {})
+    cache = ModelCache(reg, max_models=2)
+
+    assert cache.get("a") == ({"cohort": "a"}, {})
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+
+    assert ("a", 1) in cache and ("c", 1) in cache and ("b", 1) not in cache
+    assert len(cache) == 2
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 3
+    assert cache.stats["loads"] == 3
+    assert cache.stats["evictions"] == 1
+
+
+def test_cache_evicts_by_bytes(reg):
+    for cohort in ["a", "b"]:
+        reg.register(cohort, {"payload": "x" * 1000}, {})
+    size = sum(os.path.getsize(p) for p in reg.artifact_paths("a"))
+    cache = ModelCache(reg, max_models=10, max_artifact_bytes=size + 1)
+
+    cache.get("a")
+    assert cache.stats["artifact_bytes"] == size
+    cache.get("b")
+    assert ("a", 1) not in cache and len(cache) == 1
+    assert cache.stats["artifact_bytes"] == size
+    assert cache.stats["evictions"] == 1
+
+
+def test_concurrent_misses_count_one_load(reg, monkeypatch):
+    reg.register("a", {"v": 1}, {})
+    cache = ModelCache(reg)
+    real_load = joblib.load
+
+    def slow_load(path):
+        time.sleep(0.05)
+        return real_load(path)
+
+    monkeypatch.setattr(registry.joblib, "load", slow_load)
+    threads = [threading.Thread(target=cache.get, args=("a",)) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert cache.stats["misses"] == 2
+    assert cache.stats["loads"] == 1
+    assert len(cache) == 1
+
+
+def test_cache_picks_up_new_versions(reg):
+    reg.register("a", {"v": 1}, {})
+    cache = ModelCache(reg)
+    assert cache.get("a") == ({"v": 1}, {})
+    reg.register("a", {"v": 2}, {})
+    assert cache.get("a") == ({"v": 2}, {})
+    assert cache.get("a", version=1) == ({"v": 1}, {})
+
+
+def test_get_cache_rejects_conflicting_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry, "_cache", None)
+    cache = get_cache(str(tmp_path), max_models=3)
+    assert get_cache() is cache
+    assert get_cache(max_models=3) is cache
+    with pytest.raises(ValueError):
+        get_cache(max_models=4)